@@ -1,8 +1,8 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import json
-import os
+import numpy as np
+
+from floorplan_core import room_types, to_feet, load_properties, save_properties, compare_properties, draw_floorplan, summary_csv
 
 # -----------------------------------
 # Page Setup
@@ -12,31 +12,46 @@ st.set_page_config(page_title="Floorplan & Area Calculator", layout="wide")
 st.title("🏠 Floorplan & Area Calculator")
 st.caption("Enter room counts → dimensions → get areas + auto floorplan → save multiple properties permanently.")
 
-# -----------------------------------
-# Persistent Storage
-# -----------------------------------
-DATA_FILE = "properties.json"
+properties_data = load_properties()
 
-def load_properties():
-    if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "r") as f:
-            return json.load(f)
-    return {}
+# Compare/delete UI, also shown when there are no rooms to compute yet
+def saved_properties_section():
+    # -----------------------------------
+    # Compare Saved Properties
+    # -----------------------------------
+    st.header("📊 Compare Saved Properties")
 
-def save_properties(data):
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=4)
+    if properties_data:
+        compare_df = compare_properties()
 
-properties_data = load_properties()
+        st.dataframe(compare_df)
 
-# -----------------------------------
-# Helper Functions
-# -----------------------------------
-def to_feet(ft, inch):
-    return ft + inch / 12
+    else:
+        st.info("No properties saved yet.")
+
+    # -----------------------------------
+    # Delete a Saved Property
+    # -----------------------------------
+    st.header("🗑️ Delete Saved Property")
+
+    if properties_data:
+        delete_choice = st.selectbox(
+            "Select a property to delete",
+            options=list(properties_data.keys()),
+            index=None,
+            placeholder="Choose a property..."
+        )
+
+        if delete_choice:
+            if st.button("❌ Delete Selected Property"):
+                del properties_data[delete_choice]
+                save_properties(properties_data)
+                st.success(f"Deleted '{delete_choice}' successfully!")
+
+                st.rerun()
 
-def room_area(l_ft, l_in, b_ft, b_in):
-    return to_feet(l_ft, l_in) * to_feet(b_ft, b_in)
+    else:
+        st.info("No properties available to delete.")
 
 # -----------------------------------
 # UI: Property Name
@@ -44,21 +59,6 @@ def room_area(l_ft, l_in, b_ft, b_in):
 st.subheader("🏷 Property Name")
 property_name = st.text_input("Name your property", placeholder="e.g., Galaxy Heights 402")
 
-# -----------------------------------
-# Define Room Types
-# -----------------------------------
-room_types = {
-    "Bedrooms": "Bedroom",
-    "Toilets": "Toilet",
-    "Drawing Room": "Drawing",
-    "Foyer": "Foyer",
-    "Dining": "Dining",
-    "Kitchen": "Kitchen",
-    "Wash Area": "Wash",
-    "Balcony": "Balcony",
-    "Store Room": "Store"
-}
-
 # -----------------------------------
 # Room Counts
 # -----------------------------------
@@ -72,142 +72,135 @@ for label in room_types:
     room_counts[label] = cols[i].number_input(label, min_value=0, max_value=10, value=0)
     i = (i + 1) % 3
 
+# Nothing to compute until at least one room is added
+if not any(room_counts.values()):
+    st.info("Enter room counts to begin.")
+    saved_properties_section()
+    st.stop()
+
 # -----------------------------------
 # Room Dimensions Input
 # -----------------------------------
 st.subheader("2️⃣ Enter Room Dimensions")
 
-summary = []
-total_area = 0
-
-for label, prefix in room_types.items():
-    count = room_counts[label]
-    if count == 0:
-        continue
-
-    with st.expander(f"{label} ({count})"):
-        for i in range(1, count + 1):
-            cols = st.columns(4)
-            
-            L_ft = cols[0].number_input(f"L ft - {i}", min_value=0.0, key=f"{prefix}_Lft_{i}")
-            L_in = cols[1].number_input(f"L in - {i}", min_value=0.0, key=f"{prefix}_Lin_{i}")
-            B_ft = cols[2].number_input(f"B ft - {i}", min_value=0.0, key=f"{prefix}_Bft_{i}")
-            B_in = cols[3].number_input(f"B in - {i}", min_value=0.0, key=f"{prefix}_Bin_{i}")
-
-            area = room_area(L_ft, L_in, B_ft, B_in)
-            total_area += area
+names = [f"{prefix} {i}" for label, prefix in room_types.items() for i in range(1, room_counts[label] + 1)]
+cats = [label for label in room_types for _ in range(room_counts[label])]
+
+# One editor for every room instead of four number_inputs per room.
+# Entered values live per room name in room_dims, which only the submit
+# callback writes; the editor's own output is never fed back into its input.
+dim_cols = ["L ft", "L in", "B ft", "B in"]
+room_dims = st.session_state.setdefault("room_dims", {})
+
+# The seed frame only changes when the set of rooms does, so the editor keeps
+# one identity (and one cumulative set of edits) across repeated submits
+if st.session_state.get("dims_seed_names") != names:
+    seed = pd.DataFrame([room_dims.get(name, [0.0] * 4) for name in names], columns=dim_cols)
+    seed.insert(0, "Room", names)
+    st.session_state["dims_seed"] = seed
+    st.session_state["dims_seed_names"] = names
+    # Fresh editor key per seed: row-indexed edits from the old room list
+    # must never be applied to rows that a count change has shifted
+    st.session_state["dims_editor_key"] = f"dimensions_editor_{st.session_state.get('dims_seed_gen', 0)}"
+    st.session_state["dims_seed_gen"] = st.session_state.get("dims_seed_gen", 0) + 1
+
+def store_dims():
+    # edited_rows holds every edit since the seed was built, keyed by row
+    seed = st.session_state["dims_seed"]
+    edits = st.session_state[st.session_state["dims_editor_key"]]["edited_rows"]
+    for row, changes in edits.items():
+        row = int(row)
+        values = seed.loc[row, dim_cols].tolist()
+        for col, value in changes.items():
+            values[dim_cols.index(col)] = 0.0 if value is None else float(value)
+        room_dims[seed.at[row, "Room"]] = values
+
+# Edits inside the form are sent together, so the app reruns once per submit
+with st.form("dimensions"):
+    dim_column = st.column_config.NumberColumn(min_value=0.0)
+    st.data_editor(
+        st.session_state["dims_seed"],
+        key=st.session_state["dims_editor_key"],
+        num_rows="fixed",
+        disabled=["Room"],
+        hide_index=True,
+        column_config={col: dim_column for col in dim_cols}
+    )
+    st.form_submit_button("Compute Areas", on_click=store_dims)
 
-            st.write(f"➡ **Room {i} Area:** {area:.2f} sq ft")
+# -----------------------------------
+# Area Computation
+# -----------------------------------
+dims = np.array([room_dims.get(name, [0.0] * 4) for name in names], dtype=float)
 
-            summary.append({
-                "Room": f"{prefix} {i}",
-                "Category": label,
-                "Length (ft)": to_feet(L_ft, L_in),
-                "Breadth (ft)": to_feet(B_ft, B_in),
-                "Area (sqft)": area
-            })
+a = to_feet(dims[:, 0], dims[:, 1])
+b = to_feet(dims[:, 2], dims[:, 3])
+areas = a * b
+total_area = areas.sum()
 
 # -----------------------------------
 # Summary Table
 # -----------------------------------
-df = pd.DataFrame(summary)
+df = pd.DataFrame({
+    "Room": names,
+    "Category": cats,
+    "Length (ft)": a,
+    "Breadth (ft)": b,
+    "Area (sqft)": areas
+})
 
 st.subheader("3️⃣ Summary")
 
-if df.empty:
-    st.info("Add rooms to see details.")
-else:
-    st.dataframe(df, height=300)
+st.dataframe(df, height=300)
+
+csv = summary_csv(df)
+st.download_button("📥 Download CSV", csv, "area_summary.csv", "text/csv")
 
-    csv = df.to_csv(index=False).encode('utf-8')
-    st.download_button("📥 Download CSV", csv, "area_summary.csv", "text/csv")
+# -----------------------------------
+# Floorplan
+# -----------------------------------
+st.subheader("4️⃣ Floorplan")
+
+if st.button("🖼 Render Floorplan"):
+    st.session_state["render_fp"] = True
+
+# Only render once the user has asked for it; stays on for later reruns
+if st.session_state.get("render_fp"):
+    draw_floorplan(df)
 
 # -----------------------------------
 # Totals
 # -----------------------------------
 st.subheader("5️⃣ Total Areas")
 
-total_sqft = None
-total_sqyd = None
-claimed_area = None
-claimed_area_sqyd = None
-
-if not df.empty:
-    total_sqft = total_area
-    total_sqyd = total_sqft / 9
-    claimed_area = total_sqft / 0.75
-    claimed_area_sqyd = claimed_area / 9
+total_sqft = total_area
+total_sqyd = total_sqft / 9
+claimed_area = total_sqft / 0.75
+claimed_area_sqyd = claimed_area / 9
 
-    st.metric("Carpet Area", f"{total_sqft:.1f} sq ft")
-    st.metric("Carpet Area", f"{total_sqyd:.1f} sq yd")
+st.metric("Carpet Area", f"{total_sqft:.1f} sq ft")
+st.metric("Carpet Area", f"{total_sqyd:.1f} sq yd")
 
-    st.write("---")
+st.write("---")
 
-    st.metric("Claimed Area", f"{claimed_area:.1f} sq ft")
-    st.metric("Claimed Area", f"{claimed_area_sqyd:.1f} sq yd")
+st.metric("Claimed Area", f"{claimed_area:.1f} sq ft")
+st.metric("Claimed Area", f"{claimed_area_sqyd:.1f} sq yd")
 
-    st.success("Calculation complete!")
+st.success("Calculation complete!")
 
 # -----------------------------------
 # Save Property  (FIXED)
 # -----------------------------------
-if not df.empty and property_name.strip() and claimed_area_sqyd is not None:
+if property_name.strip():
     if st.button("💾 Save Property"):
         properties_data[property_name] = {
             "rooms": df.to_dict(orient="records"),
-            "total_sqft": float(total_sqft),
-            "total_sqyd": float(total_sqyd),
-            "claimed_area": float(claimed_area),
-            "claimed_area_sqyd": float(claimed_area_sqyd)   # ✔ correctly saving computed value
+            "total_sqft": total_sqft,
+            "total_sqyd": total_sqyd,
+            "claimed_area": claimed_area,
+            "claimed_area_sqyd": claimed_area_sqyd   # ✔ correctly saving computed value
         }
         save_properties(properties_data)
         st.success(f"Saved '{property_name}' successfully!")
 
-# -----------------------------------
-# Compare Saved Properties
-# -----------------------------------
-st.header("📊 Compare Saved Properties")
-
-if properties_data:
-    compare_df = pd.DataFrame([
-        {
-            "Property": name,
-            "Carpet Area (sqft)": info.get("total_sqft"),
-            "Carpet Area (sqyd)": info.get("total_sqyd"),
-            "Claimed Area (sqft)": info.get("claimed_area"),
-            "Claimed Area (sqyd)": info.get("claimed_area_sqyd", info["claimed_area"] / 9),
-        }
-        for name, info in properties_data.items()
-    ])
-
-    st.dataframe(compare_df)
-
-else:
-    st.info("No properties saved yet.")
-# -----------------------------------
-# Delete a Saved Property
-# -----------------------------------
-st.header("🗑️ Delete Saved Property")
-
-if properties_data:
-    delete_choice = st.selectbox(
-        "Select a property to delete",
-        options=list(properties_data.keys()),
-        index=None,
-        placeholder="Choose a property..."
-    )
-
-    if delete_choice:
-        if st.button("❌ Delete Selected Property"):
-            del properties_data[delete_choice]
-            save_properties(properties_data)
-            st.success(f"Deleted '{delete_choice}' successfully!")
-
-            st.rerun()
-
-else:
-    st.info("No properties available to delete.")
-
-
-
-
+saved_properties_section()
@@ -0,0 +1,142 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from html import escape
+import orjson
+import os
+import tempfile
+
+# -----------------------------------
+# Persistent Storage
+# -----------------------------------
+DATA_FILE = "properties.json"
+
+def _data_mtime():
+    try:
+        return os.path.getmtime(DATA_FILE)
+    except OSError:
+        return None
+
+# Keyed on the file's mtime, so a rerun only re-parses after the file changed
+@st.cache_data
+def _load_props_cached(mtime):
+    if mtime is None:
+        return {}
+    with open(DATA_FILE, "rb") as f:
+        return orjson.loads(f.read())
+
+def load_properties():
+    return _load_props_cached(_data_mtime())
+
+def save_properties(data):
+    # Unique temp file per call: sessions share one process and may save at once
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(DATA_FILE)), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # OPT_SERIALIZE_NUMPY lets the NumPy totals be saved without casting
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(tmp_file, DATA_FILE)
+    except BaseException:
+        os.unlink(tmp_file)
+        raise
+    _load_props_cached.clear()
+    _build_compare_df.clear()
+
+# Rebuilt only when the data file changes, alongside _load_props_cached
+@st.cache_data
+def _build_compare_df(mtime):
+    props = _load_props_cached(mtime)
+    infos = list(props.values())
+    return pd.DataFrame({
+        "Property": list(props),
+        "Carpet Area (sqft)": [info.get("total_sqft") for info in infos],
+        "Carpet Area (sqyd)": [info.get("total_sqyd") for info in infos],
+        "Claimed Area (sqft)": [info.get("claimed_area") for info in infos],
+        "Claimed Area (sqyd)": [info.get("claimed_area_sqyd", info["claimed_area"] / 9) for info in infos],
+    })
+
+def compare_properties():
+    return _build_compare_df(_data_mtime())
+
+# -----------------------------------
+# Helper Functions
+# -----------------------------------
+def to_feet(ft, inch):
+    return ft + inch / 12
+
+def room_area(l_ft, l_in, b_ft, b_in):
+    return to_feet(l_ft, l_in) * to_feet(b_ft, b_in)
+
+# Exact cache key for a rooms DataFrame: the raw geometry bytes plus the
+# room names (they're drawn as labels too). Cheap for st.cache_data to hash,
+# and unlike a checksum two different plans can never share a key.
+def frame_key(df):
+    geom = np.ascontiguousarray(df[["Length (ft)", "Breadth (ft)"]].to_numpy(dtype=float))
+    return geom.tobytes(), tuple(df["Room"])
+
+@st.cache_data(max_entries=16)
+def _csv_bytes(key: tuple, _df) -> bytes:
+    return _df.to_csv(index=False).encode('utf-8')
+
+def summary_csv(df):
+    # Category and area are exported too; area follows from L x B, but
+    # Category is keyed explicitly so the bytes can't come from another frame
+    return _csv_bytes((frame_key(df), tuple(df["Category"])), df)
+
+# Fixed on-screen box; the plan is scaled to fit it whatever its size
+FLOORPLAN_HEIGHT_PX = 600
+
+@st.cache_data(ttl=None, max_entries=16)
+def _build_floorplan_svg(key: tuple, _df) -> str:
+    names = _df["Room"].to_numpy()
+    L = _df["Length (ft)"].to_numpy(dtype=float)
+    B = _df["Breadth (ft)"].to_numpy(dtype=float)
+    areas = _df["Area (sqft)"].to_numpy()
+    y_starts = np.concatenate([[0], np.cumsum(B + 1)])
+    y0 = y_starts[:-1]
+    offset_y = y_starts[-1]
+
+    width = L.max() + 5
+    height = offset_y + 5
+    # SVG's y axis points down; flip so the first room sits at the bottom
+    top = height - (y0 + B)
+    # Labels scale with the plan so they stay readable once it's fitted
+    font_size = max(width, height) / 60
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width:g} {height:g}" '
+        f'width="100%" height="{FLOORPLAN_HEIGHT_PX}" preserveAspectRatio="xMidYMid meet" '
+        f'font-family="sans-serif" font-size="{font_size:g}" text-anchor="middle">'
+    ]
+    for name, l, y, b, area in zip(names, L, top, B, areas):
+        cx = l / 2
+        cy = y + b / 2
+        parts.append(
+            f'<rect x="0" y="{y:g}" width="{l:g}" height="{b:g}" fill="none" stroke="black" '
+            f'stroke-width="1" vector-effect="non-scaling-stroke"/>'
+            f'<text x="{cx:g}" y="{cy:g}">'
+            f'<tspan x="{cx:g}" dy="-0.2em">{escape(name)}</tspan>'
+            f'<tspan x="{cx:g}" dy="1.2em">{area:.1f} sq ft</tspan></text>'
+        )
+    parts.append("</svg>")
+
+    return "".join(parts)
+
+def draw_floorplan(df):
+    # Drawn by the browser; no server-side rasterization
+    st.markdown(_build_floorplan_svg(frame_key(df), df), unsafe_allow_html=True)
+
+# -----------------------------------
+# Define Room Types
+# -----------------------------------
+room_types = {
+    "Bedrooms": "Bedroom",
+    "Toilets": "Toilet",
+    "Drawing Room": "Drawing",
+    "Foyer": "Foyer",
+    "Dining": "Dining",
+    "Kitchen": "Kitchen",
+    "Wash Area": "Wash",
+    "Balcony": "Balcony",
+    "Store Room": "Store"
+}